@@ -5,12 +5,11 @@ from pathlib import Path
 
 
 __all__ = [
-    "BATTLEYE_GLOB",
     "BACKUPS_DIR",
+    "BATTLEYE_GLOB",
     "CONFIG_FILE",
     "DAYZ_APP_ID",
     "DAYZ_SERVER_APP_ID",
-    "STRIKETHROUGH",
     "JSON_FILE",
     "LINK",
     "MESSAGE_TEMPLATE_SHUTDOWN",
@@ -19,6 +18,7 @@ __all__ = [
     "PROCESS_NAME",
     "SERVER_EXECUTABLE",
     "STEAMCMD",
+    "STRIKETHROUGH",
     "UNSUPPORTED_OS",
     "WORKSHOP_URL",
 ]
@@ -1,6 +1,13 @@
 """Watchdog to detect server and mod updates."""
 
-__all__ = ["hash_changed"]
+from functools import lru_cache
+from pathlib import Path
+
+
+__all__ = ["cached_sha1sum", "hash_changed", "sha1sum"]
+
+
+BLOCK_SIZE = 1024 * 1024
 
 
 def hash_changed(old: dict[str, str], new: dict[str, str]) -> bool:
@@ -11,3 +18,24 @@ def hash_changed(old: dict[str, str], new: dict[str, str]) -> bool:
             return True
 
     return any(key not in old for key in new)
+
+
+def sha1sum(path: Path, block_size: int = BLOCK_SIZE) -> str:
+    """Returns the SHA-1 checksum of the given file."""
+
+    from hashlib import sha1
+
+    checksum = sha1()
+
+    with path.open("rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            checksum.update(block)
+
+    return checksum.hexdigest()
+
+
+@lru_cache(maxsize=8192)
+def cached_sha1sum(path: str, mtime_ns: int, size: int) -> str:
+    """Returns the SHA-1 checksum of a file, cached by path, mtime and size."""
+
+    return sha1sum(Path(path))
@@ -2,46 +2,76 @@
 
 from __future__ import annotations
 
-from hashlib import sha1
+import sys
+from dataclasses import dataclass, field
 from logging import getLogger
+from os import lstat, name as os_name, scandir, sep as os_sep, symlink
+from os.path import lexists
 from pathlib import Path
-from shutil import rmtree
-from typing import Iterable, Iterator, NamedTuple, Optional
+from stat import S_ISLNK
+from typing import Iterable, Iterator, Optional
 
 from dzdsu.constants import LINK
 from dzdsu.constants import MODS_DIR
 from dzdsu.constants import STRIKETHROUGH
 from dzdsu.constants import WORKSHOP_URL
+from dzdsu.hash import cached_sha1sum
 
 __all__ = ["Mod", "InstalledMod", "mods_str", "print_mods"]
 
+LOGGER = getLogger(__name__)
 
-class Mod(NamedTuple):
+# Names of the Mod factory methods by value type.
+_FACTORIES: dict[type, str] = {int: "from_id", dict: "from_json"}
+
+# Pre-split templates for plain string concatenation.
+_URL_START, _URL_END = WORKSHOP_URL.split("{}")
+_LINK_START, _LINK_REST = LINK.split("{url}")
+_LINK_SEP, _LINK_END = _LINK_REST.split("{text}")
+_STRIKETHROUGH_START, _STRIKETHROUGH_END = STRIKETHROUGH.split("{}")
+
+
+@dataclass(frozen=True, order=True, slots=True)
+class Mod:
     """A server mod."""
 
     id: int
     name: Optional[str] = None
     enabled: bool = True
     update: bool = True
+    path: Path = field(init=False, repr=False, compare=False)
+    text: str = field(init=False, repr=False, compare=False)
+    url: str = field(init=False, repr=False, compare=False)
+    url_string: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Derived attributes are computed once per instance.
+        # The path is purely lexical and symlinks are not resolved.
+        text = self.name or str(self.id)
+        url = _URL_START + str(self.id) + _URL_END
+        object.__setattr__(self, "path", MODS_DIR / str(self.id))
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "url", url)
+        object.__setattr__(
+            self, "url_string", _LINK_START + url + _LINK_SEP + text + _LINK_END
+        )
 
     def __str__(self) -> str:
         if self.enabled:
             return self.url_string
 
-        return STRIKETHROUGH.format(self.url_string)
+        return _STRIKETHROUGH_START + self.url_string + _STRIKETHROUGH_END
 
     @classmethod
     def from_id(
         cls, ident: int, *, name: Optional[str] = None, update: bool = True
     ) -> Mod:
         """Creates a mod from an ID."""
-        if ident == 0:
+        if not ident:
             raise ValueError(f"Invalid mod ID: {ident}")
 
-        if ident < 0:
-            return cls(abs(ident), name, enabled=False, update=update)
-
-        return cls(ident, name, update=update)
+        enabled = ident > 0
+        return cls(ident if enabled else -ident, name, enabled=enabled, update=update)
 
     @classmethod
     def from_json(cls, json: dict[str, int | str | bool]) -> Mod:
@@ -53,45 +83,29 @@ class Mod(NamedTuple):
     @classmethod
     def from_value(cls, value: int | dict[str, int | str]) -> Mod:
         """Creates a mod from an int or JSON value."""
-        if isinstance(value, int):
-            return cls.from_id(value)
-
-        if isinstance(value, dict):
-            return cls.from_json(value)
-
-        raise TypeError(f"Cannot create mod from: {value} ({type(value)})")
-
-    @property
-    def path(self) -> Path:
-        """Returns the relative path to the local mod directory."""
-        return MODS_DIR / str(self.id)
-
-    @property
-    def text(self) -> str:
-        """Returns the URL text."""
-        return self.name or str(self.id)
+        try:
+            factory = _FACTORIES[type(value)]
+        except KeyError:
+            raise TypeError(
+                f"Cannot create mod from: {value} ({type(value)})"
+            ) from None
 
-    @property
-    def url(self) -> str:
-        """Returns the Steam Workshop URL."""
-        return WORKSHOP_URL.format(self.id)
-
-    @property
-    def url_string(self) -> str:
-        """Returns the URL string."""
-        return LINK.format(url=self.url, text=self.text)
+        return getattr(cls, factory)(value)
 
 
-class InstalledMod(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class InstalledMod:
     """Represents an installed mod."""
 
     mod: Mod
     base_dir: Path
+    path: Path = field(init=False, repr=False, compare=False)
 
-    @property
-    def path(self) -> Path:
-        """Returns the relative path to the local mod directory."""
-        return self.base_dir / self.mod.path
+    def __post_init__(self):
+        # The path to the local mod directory, joined once per instance.
+        # Symlinks are intentionally not resolved here,
+        # but left to the OS when the path is actually opened.
+        object.__setattr__(self, "path", self.base_dir / self.mod.path)
 
     @property
     def addons(self) -> Path:
@@ -111,59 +125,104 @@ class InstalledMod(NamedTuple):
     @property
     def sha1sum(self) -> str:
         """Returns the SHA-1 checksum."""
-        with self.metadata.open("rb") as file:
-            return sha1(file.read()).hexdigest()
+        stat = (metadata := self.metadata).stat()
+        return cached_sha1sum(str(metadata), stat.st_mtime_ns, stat.st_size)
 
     @property
     def pbos(self) -> Iterator[Path]:
         """Yields paths to the .pbo files."""
-        return self.addons.glob("*.pbo")
+        return iterfiles(self.addons, ".pbo")
 
     @property
     def bikeys(self) -> Iterator[Path]:
         """Yields paths to the *.bikey files."""
-        return self.keys.glob("*.bikey")
+        return iterfiles(self.keys, ".bikey")
 
     def fix_paths(self) -> None:
         """Links paths to lower-case."""
-        if (addons := self.path / "Addons").is_dir():
-            link_to_lowercase(addons)
+        with scandir(self.path) as entries:
+            directories = {entry.name for entry in entries if entry.is_dir()}
+
+        if "Addons" in directories:
+            link_to_lowercase(self.path / "Addons")
 
-        if (keys := self.path / "Keys").is_dir():
-            link_to_lowercase(keys)
+        if "Keys" in directories:
+            link_to_lowercase(self.path / "Keys")
 
-        if not self.keys.exists() and (key := self.path / "key").is_dir():
-            self.keys.symlink_to(key)
+        if "key" in directories and not lexists(self.keys):
+            symlink("key", self.keys)
 
-        for pbo in self.pbos:
+        # Snapshot the directory listing, since we add symlinks to it.
+        for pbo in list(self.pbos):
             link_to_lowercase(pbo)
 
     def remove(self) -> None:
         """Removes this mod."""
+        # Raise like rmtree(): FileNotFoundError if missing, symlinks refused.
+        if os_name == "posix" and not S_ISLNK(lstat(self.path).st_mode):
+            from subprocess import DEVNULL, PIPE, run
+
+            try:
+                # rm(1) walks the tree in C, much faster than rmtree().
+                result = run(
+                    ["rm", "-rf", "--", str(self.path)],
+                    stdin=DEVNULL,
+                    stderr=PIPE,
+                    text=True,
+                    check=False,
+                )
+            except FileNotFoundError:
+                pass  # rm(1) is not available, fall back to rmtree().
+            else:
+                if result.returncode != 0:
+                    raise OSError(
+                        result.stderr.strip()
+                        or f"rm exited with status {result.returncode}"
+                    )
+
+                return
+
+        from shutil import rmtree
+
         rmtree(self.path)
 
 
+def iterfiles(directory: Path, suffix: str) -> Iterator[Path]:
+    """Yields files in the given directory with the given suffix."""
+
+    try:
+        entries = scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield Path(entry.path)
+
+
 def link_to_lowercase(path: Path) -> None:
     """Creates a symlink with the path names in lower case."""
 
     if (filename := path.name) == (lower := filename.lower()):
         return
 
-    if (symlink := path.parent / lower).exists():
+    try:
+        symlink(filename, link := path.parent / lower)
+    except FileExistsError:
         return
 
-    getLogger(__file__).debug('Linking "%s" to "%s".', filename, symlink)
-    symlink.symlink_to(filename)
+    LOGGER.debug('Linked "%s" to "%s".', filename, link)
 
 
 def mods_str(mods: Iterable[Mod], sep: str = ";") -> str:
     """Returns a string representation of the given mods."""
 
-    return sep.join(str(mod.path) for mod in mods)
+    prefix = f"{MODS_DIR}{os_sep}"
+    return sep.join(prefix + str(mod.id) for mod in mods)
 
 
 def print_mods(mods: Iterable[Mod]) -> None:
     """Lists the respective mods."""
 
-    for mod in mods:
-        print(mod)
+    sys.stdout.write("".join(f"{mod}\n" for mod in mods))
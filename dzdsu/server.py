@@ -3,7 +3,6 @@
 from __future__ import annotations
 from configparser import SectionProxy
 from contextlib import suppress
-from hashlib import sha1
 from itertools import chain
 from json import dump, load
 from pathlib import Path
@@ -17,7 +16,7 @@ from dzdsu.constants import JSON_FILE
 from dzdsu.constants import MODS_DIR
 from dzdsu.constants import PROCESS_NAME
 from dzdsu.constants import SERVER_EXECUTABLE
-from dzdsu.hash import hash_changed
+from dzdsu.hash import hash_changed, sha1sum
 from dzdsu.lockfile import LockFile
 from dzdsu.mission import Mission
 from dzdsu.mods import Mod, InstalledMod, mods_str
@@ -193,8 +192,7 @@ class Server(NamedTuple):
     @property
     def sha1sum(self) -> str:
         """Returns the SHA-1 checksum."""
-        with self.executable_path.open("rb") as file:
-            return sha1(file.read()).hexdigest()
+        return sha1sum(self.executable_path)
 
     @property
     def unused_mods(self) -> Iterator[InstalledMod]: